@@ -1,10 +1,230 @@
 # inventor_api.py (Enhanced)
-import pythoncom
-import win32com.client
-from typing import Dict, Any, Optional
+import asyncio
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial, wraps
+from types import MappingProxyType
+from typing import Dict, Any, AsyncIterator, Iterator, List, Mapping, Optional
+
+
+log = logging.getLogger(__name__)
+
+INVENTOR_PROG_ID = "Inventor.Application"
+
+# pywin32 (pythoncom, pywintypes, win32com.client) is imported inside the
+# functions that talk to COM, not at module level: win32com.client is slow to
+# import, and the server should answer /, /inventor/health before the first
+# Inventor call. Repeat imports are just a sys.modules lookup.
+
+# HRESULTs meaning the cached Inventor proxy is gone (Inventor closed or restarted)
+_STALE_HRESULTS = {
+    -2147221021,  # MK_E_UNAVAILABLE (0x800401E3)
+    -2147417848,  # RPC_E_DISCONNECTED (0x80010108)
+    -2147023174,  # RPC_S_SERVER_UNAVAILABLE (0x800706BA)
+    -2147023170,  # RPC_S_CALL_FAILED (0x800706BE)
+}
+
+# HRESULTs that say nothing about the request itself - Inventor was busy
+# (modal dialog, recompute) or went away - so the call is worth repeating later
+_TRANSIENT_HRESULTS = _STALE_HRESULTS | {
+    -2147418111,  # RPC_E_CALL_REJECTED (0x80010001)
+    -2147417846,  # RPC_E_SERVERCALL_RETRYLATER (0x8001010A)
+}
+
+# Early-bound Application.ActiveDocument is typed as the generic Document
+# interface; ComponentDefinition only exists on the concrete document
+# interfaces, so part/assembly documents are cast to them (DocumentTypeEnum).
+_DOCUMENT_INTERFACES = {
+    12290: "PartDocument",      # kPartDocumentObject
+    12291: "AssemblyDocument",  # kAssemblyDocumentObject
+}
+
+# Comment mapping grammar: CA<digits>:<symbol> [#<note>]
+# - symbol: non-empty, no ':' (MathJS compatibility) or '#', surrounding spaces trimmed
+# - note: everything after the first '#' (may itself contain '#')
+_COMMENT_RE = re.compile(
+    r'\s*CA\s*\d+\s*:\s*([^:#\s](?:[^:#]*[^:#\s])?)\s*(?:#(.*))?',
+    re.DOTALL
+)
+
+# Result for comments that carry no CalcsLive mapping (read-only, shared)
+_NO_MAPPING = MappingProxyType({"mapping": None, "note": None})
+
+# Database (internal) unit per display unit, e.g. "mm" -> "cm", "deg" -> "rad"
+# ("" if Inventor rejected the unit). Fixed by Inventor for each unit type,
+# so safe to share across documents. Only answers Inventor actually gave are
+# stored - a lookup that hit a transient COM error is retried on the next read.
+_DATABASE_UNITS: Dict[str, str] = {}
+
+# Last get_user_parameters() result, reused for bursts of reads against the same
+# document (e.g. several dashboard tabs, or /inventor/document right after
+# /inventor/parameters). Inventor exposes no cheap in-memory change counter
+# for parameter edits made in its UI, so entries expire after a short max age,
+# and writes made through this module drop the entry immediately.
+_PARAMETERS_CACHE_MAX_AGE = 0.5  # seconds
+_parameters_cache: Dict[str, Any] = {"document": None, "timestamp": 0.0, "generation": 0, "result": None}
+
+# COM proxies are bound to the apartment (thread) that created them,
+# so COM initialization and the Application handle are tracked per thread.
+_com_state = threading.local()
+
+
+def init_com() -> None:
+    """
+    Initialize COM (single-threaded apartment) for the calling thread, once.
+
+    Safe to call repeatedly - only the first call on each thread reaches
+    CoInitializeEx. The API functions below call this lazily through
+    _get_app(), so hosts only need to call it explicitly to pay the cost
+    up front (e.g. from a worker thread initializer).
+    """
+    if not getattr(_com_state, "com_inited", False):
+        import pythoncom
+        pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+        _com_state.com_inited = True
+
+
+def shutdown_com() -> None:
+    """
+    Release the cached Inventor handle and uninitialize COM for the calling thread.
+
+    Counterpart of init_com(); no-op on threads that never initialized COM.
+    """
+    _com_state.app = None
+    if getattr(_com_state, "com_inited", False):
+        import pythoncom
+        pythoncom.CoUninitialize()
+        _com_state.com_inited = False
+
+
+def _get_app():
+    """
+    Return the cached Inventor Application proxy for the calling thread.
+
+    Connects via GetActiveObject on first use only; later calls reuse the
+    already-marshalled proxy instead of repeating the ROT lookup.
+    The proxy is early-bound through gencache, so property reads dispatch
+    straight to their DISPID instead of a GetIDsOfNames round trip each.
+    """
+    app = getattr(_com_state, "app", None)
+    if app is None:
+        init_com()
+        import win32com.client
+        app = win32com.client.gencache.EnsureDispatch(
+            win32com.client.GetActiveObject(INVENTOR_PROG_ID)
+        )
+        _com_state.app = app
+    return app
+
+
+def _cast_document(doc):
+    """Cast an early-bound Document to its concrete Part/Assembly interface."""
+    if doc is None:
+        return None
+    interface = _DOCUMENT_INTERFACES.get(doc.DocumentType)
+    if not interface:
+        return doc
+    import win32com.client
+    return win32com.client.CastTo(doc, interface)
+
+
+def _get_active_document():
+    """
+    Return Inventor's active document (None if no document is open),
+    cast to its Part/Assembly interface where applicable.
+
+    If the cached Application proxy has gone stale (Inventor was closed or
+    restarted), drops it and reconnects once.
+    """
+    import pywintypes
+
+    app = getattr(_com_state, "app", None)
+    if app is not None:
+        try:
+            return _cast_document(app.ActiveDocument)
+        except pywintypes.com_error as e:
+            if e.hresult not in _STALE_HRESULTS:
+                raise
+            _com_state.app = None
+    return _cast_document(_get_app().ActiveDocument)
 
 
-def parse_comment_mapping(comment: str) -> Dict[str, Optional[str]]:
+@contextmanager
+def _transaction(doc, display_name: str):
+    """
+    Group the writes made inside the block into one Inventor transaction,
+    so the user sees them as a single Undo step.
+    The transaction is aborted (rolled back) if the block raises.
+    """
+    transaction = _get_app().TransactionManager.StartTransaction(doc, display_name)
+    try:
+        yield
+    except BaseException:
+        transaction.Abort()
+        raise
+    transaction.End()
+
+
+def _with_inventor_doc(fn=None, *, writes: bool = False):
+    """
+    Decorator for API functions that operate on the active Inventor document.
+
+    Resolves the active document and passes it as the first argument, so the
+    public signature omits it. Returns the standard error dict when no
+    document is open or the call raises. With writes=True, the cached
+    get_user_parameters() result is dropped when the call exits.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                doc = _get_active_document()
+                if doc is None:
+                    return {"success": False, "error": "No active Inventor document"}
+                return fn(doc, *args, **kwargs)
+            except Exception as e:
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "errorType": type(e).__name__
+                }
+            finally:
+                if writes:
+                    # Parameters may have changed - next read must go to Inventor
+                    _invalidate_parameters_cache()
+        return wrapper
+
+    return decorator(fn) if fn is not None else decorator
+
+
+def _find_user_parameter(user_params, name: str):
+    """
+    Look up a User Parameter by name, returning None if it does not exist.
+
+    Inventor reports a missing name as a COM error from Item(); only that is
+    treated as "not found". A single Item() call is one COM round trip, which
+    is still cheaper than enumerating every parameter's Name to test membership.
+    """
+    import pywintypes
+
+    try:
+        return user_params.Item(name)
+    except pywintypes.com_error:
+        return None
+
+
+def _invalidate_parameters_cache() -> None:
+    """Drop the cached get_user_parameters() result after a write."""
+    _parameters_cache["generation"] += 1
+    _parameters_cache["result"] = None
+
+
+@lru_cache(maxsize=1024)
+def parse_comment_mapping(comment: str) -> Mapping[str, Optional[str]]:
     """
     Parse Inventor parameter Comment field for CalcsLive mapping.
 
@@ -22,50 +242,24 @@ def parse_comment_mapping(comment: str) -> Dict[str, Optional[str]]:
         comment: Parameter comment string
 
     Returns:
-        Dict with 'mapping' and 'note' keys
+        Read-only mapping with 'mapping' and 'note' keys
         Example: {"mapping": "L", "note": "Length parameter"}
-    """
-    result = {"mapping": None, "note": None}
-
-    if not comment or not comment.strip():
-        return result
-
-    comment = comment.strip()
-
-    # Split on first # to separate namespace:symbol from note
-    if '#' in comment:
-        mapping_part, note_part = comment.split('#', 1)  # maxsplit=1 preserves # in notes
-        result["note"] = note_part.strip() if note_part.strip() else None
-    else:
-        mapping_part = comment
-        result["note"] = None
-
-    # Parse namespace:symbol
-    mapping_part = mapping_part.strip()
-    if ':' not in mapping_part:
-        return {"mapping": None, "note": None}  # Invalid: no namespace
-
-    namespace, symbol = mapping_part.split(':', 1)
-    namespace = namespace.strip()
-    symbol = symbol.strip()
-
-    # Validate namespace (must be CA followed by digit(s))
-    if not namespace.startswith('CA') or len(namespace) < 3:
-        return {"mapping": None, "note": None}
-
-    # Validate namespace has digit after CA
-    try:
-        int(namespace[2:])  # Check CA0, CA1, etc.
-    except ValueError:
-        return {"mapping": None, "note": None}
-
-    # Validate symbol (non-empty, no colons - MathJS compatibility)
-    if not symbol or ':' in symbol:
-        return {"mapping": None, "note": None}
 
-    result["mapping"] = symbol
+    Note: Results are memoized per comment string (comments rarely change
+    between polls), so the same object is returned to every caller - it is
+    wrapped in MappingProxyType so a caller can't corrupt the cache.
+    """
+    # Most comments are free-form text; a substring scan rejects them
+    # before entering the regex engine
+    match = _COMMENT_RE.fullmatch(comment) if comment and "CA" in comment else None
+    if match is None:
+        return _NO_MAPPING
 
-    return result
+    note = match.group(2)
+    return MappingProxyType({
+        "mapping": match.group(1),
+        "note": (note.strip() or None) if note else None
+    })
 
 
 def build_comment_string(symbol: Optional[str], note: Optional[str], namespace: str = "CA0") -> str:
@@ -89,18 +283,14 @@ def build_comment_string(symbol: Optional[str], note: Optional[str], namespace:
     if not symbol:
         return ""
 
-    # Build namespace:symbol part
-    comment = f"{namespace}:{symbol}"
-
     # Append note if provided (preserve as-is, including any # or backticks)
-    if note and note.strip():
-        comment = f"{comment} #{note.strip()}"
+    note = note.strip() if note else None
+    if note:
+        return f"{namespace}:{symbol} #{note}"
 
-    return comment
+    return f"{namespace}:{symbol}"
 
 
-import re
-
 def parse_expression_user_input(expression: str) -> Dict[str, Any]:
     """
     Parse an Inventor expression to extract user-specified value and unit.
@@ -159,7 +349,149 @@ def parse_expression_user_input(expression: str) -> Dict[str, Any]:
     return result
 
 
-def get_user_parameters() -> Dict[str, Any]:
+def _read_parameter_record(get_param, index: int, get_database_units, convert, debug: bool) -> Optional[Dict[str, Any]]:
+    """
+    Read one User Parameter (1-based index) into a parameter record dict.
+
+    get_database_units/convert are the document's bound UnitsOfMeasure methods,
+    hoisted by the caller. Returns None (after logging) if the parameter can't
+    be read, so callers can skip it.
+    """
+    param_name = f"#{index}"
+    try:
+        param = get_param(index)
+        # Early-bound UserParameter exposes these statically - no hasattr probing;
+        # read them in one pass, a parameter that fails to read is skipped below
+        param_name = param.Name
+        param_value, param_unit, param_expression, param_comment = (
+            param.Value, param.Units or "", param.Expression, param.Comment
+        )
+
+        # Get internal unit and display value using Inventor's API
+        if not param_unit:
+            # Text/boolean/unitless parameters (e.g. ArticleId) need no unit
+            # lookup or conversion - skip the whole block
+            internal_unit = ""
+            display_value = param_value
+        else:
+            # The internal/database unit is what Inventor uses internally (e.g., "cm", "g", "rad").
+            # It depends only on the display unit, so it is resolved with an empty
+            # expression once per unit. A unit Inventor rejects is cached as "" so it
+            # costs one COM call and one warning, not one per poll; a transient COM
+            # error (Inventor busy, disconnected) is not cached and is retried next read
+            internal_unit = _DATABASE_UNITS.get(param_unit)
+            if internal_unit is None:
+                try:
+                    internal_unit = get_database_units("", param_unit)
+                    log.debug("[%s] GetDatabaseUnitsFromExpression('', '%s') = '%s'", param_name, param_unit, internal_unit)
+                    _DATABASE_UNITS[param_unit] = internal_unit
+                except Exception as unit_error:
+                    internal_unit = ""
+                    if getattr(unit_error, 'hresult', None) in _TRANSIENT_HRESULTS:
+                        log.warning("Could not get internal unit for '%s' (unit '%s'), will retry: %s",
+                                    param_name, param_unit, unit_error)
+                    else:
+                        log.warning("Could not get internal unit for '%s' (unit '%s'): %s", param_name, param_unit, unit_error)
+                        _DATABASE_UNITS[param_unit] = internal_unit
+
+            # Get display value using Inventor's unit conversion
+            if internal_unit == param_unit:
+                # Displayed in database units already (e.g. "cm") - nothing to convert
+                display_value = param_value
+            elif internal_unit and param_value is not None:
+                try:
+                    # Convert from internal unit to display unit
+                    display_value = convert(
+                        param_value,  # Internal/database value
+                        internal_unit,  # From internal unit (e.g., "cm", "g", "rad")
+                        param_unit  # To display unit (e.g., "mm", "kg", "deg")
+                    )
+                    log.debug("[%s] ConvertUnits(%s, '%s', '%s') = %s", param_name, param_value, internal_unit, param_unit, display_value)
+                except Exception as conv_error:
+                    # Conversion failed - use raw value as fallback
+                    display_value = param_value
+                    log.warning("Unit conversion failed for '%s': %s", param_name, conv_error)
+            else:
+                # Unresolved internal unit or no value - use raw value
+                display_value = param_value
+                log.debug("[%s] No conversion possible - using raw value %s (internal_unit='%s', param_unit='%s')",
+                          param_name, param_value, internal_unit, param_unit)
+
+        # Parse Comment field for mapping
+        comment_data = parse_comment_mapping(param_comment)
+
+        # Parse expression for userValue and userUnit
+        # If userValue exists → input param; if None → calculated/formula param
+        user_input_data = parse_expression_user_input(param_expression)
+
+        # Debug summary for angle parameters (deg, rad, °)
+        if debug and param_unit and ('deg' in param_unit.lower() or 'rad' in param_unit.lower() or '°' in param_unit):
+            log.debug(
+                "ANGLE SUMMARY [%s]: value (internal)=%s, displayValue=%s, unit (display)=%s, "
+                "internalUnit='%s', expression='%s', userValue=%s, userUnit=%s",
+                param_name, param_value, display_value, param_unit, internal_unit,
+                param_expression, user_input_data['userValue'], user_input_data['userUnit']
+            )
+
+        return {
+            "name": param_name,
+            "value": param_value,  # Inventor internal/database units
+            "displayValue": display_value,  # Value in display unit (from Inventor)
+            "unit": param_unit,  # Display unit (e.g., "mm", "in")
+            "internalUnit": internal_unit,  # Internal unit (e.g., "cm", "rad")
+            "expression": param_expression,
+            "comment": param_comment,
+            "mapping": comment_data["mapping"],
+            "note": comment_data["note"],
+            "userValue": user_input_data["userValue"],  # User-typed value (None if calculated)
+            "userUnit": user_input_data["userUnit"]  # User-typed unit (None if calculated)
+        }
+
+    except Exception as param_error:
+        # If we can't read this parameter, skip it and log
+        log.warning("Could not read parameter '%s': %s", param_name, param_error)
+        return None
+
+
+def _copy_parameters_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a cached get_user_parameters() response for one caller.
+
+    The cached response outlives the call that built it, so every caller gets
+    its own envelope, list and records - mutating them can't change what other
+    readers see. Copying dicts is microseconds; the read it saves is COM calls.
+    """
+    return {**response, "parameters": [dict(record) for record in response["parameters"]]}
+
+
+def _parameter_reader(doc, component_definition):
+    """
+    Prepare to read a document's User Parameters.
+
+    Shared by get_user_parameters() and iter_user_parameters(). Returns
+    (count, read_record), where read_record(index) returns the record for the
+    1-based index, or None if that parameter can't be read.
+    """
+    # Get User Parameters ONLY (not all Parameters)
+    user_params = component_definition.Parameters.UserParameters
+
+    # Hoist COM objects and bound methods used on every iteration out of the loop
+    uom = doc.UnitsOfMeasure
+
+    # Indexed access (1-based) on the early-bound collection rather than the
+    # IEnumVARIANT enumerator, which wraps every step in extra COM calls
+    read_record = partial(
+        _read_parameter_record,
+        user_params.Item,
+        get_database_units=uom.GetDatabaseUnitsFromExpression,
+        convert=uom.ConvertUnits,
+        debug=log.isEnabledFor(logging.DEBUG)
+    )
+    return user_params.Count, read_record
+
+
+@_with_inventor_doc
+def get_user_parameters(doc) -> Dict[str, Any]:
     """
     Get User Parameters ONLY from active Inventor document.
     Works for Parts and Assemblies - treats them the same (single component approach).
@@ -181,7 +513,7 @@ def get_user_parameters() -> Dict[str, Any]:
                     "value": 500.0,  # Inventor internal units (cm)
                     "unit": "mm",    # User's display unit
                     "expression": "",
-                    "comment": "#AC:L #Note:{{Main beam length}}",
+                    "comment": "CA0:L #Main beam length",
                     "mapping": "L",
                     "note": "Main beam length",
                     "isReadOnly": False
@@ -194,138 +526,148 @@ def get_user_parameters() -> Dict[str, Any]:
         - Convert: inventor_cm_value / (100^L) = si_m_value
         - Where L is the length dimension power from dimensional analysis
     """
-    pythoncom.CoInitialize()
+    # Check if ComponentDefinition exists (works for Parts and Assemblies)
+    # EAFP: one attribute read instead of hasattr() plus a second read
     try:
-        # Connect to running Inventor instance
-        app = win32com.client.GetActiveObject("Inventor.Application")
-        doc = app.ActiveDocument
+        component_definition = doc.ComponentDefinition
+    except AttributeError:
+        return {
+            "success": False,
+            "error": "Document does not have ComponentDefinition"
+        }
 
-        # Verify document exists
-        if doc is None:
-            return {"success": False, "error": "No active Inventor document"}
+    # Reuse a very recent result for the same document (see _parameters_cache)
+    document_key = (doc.FullFileName, doc.DisplayName)
+    started = time.monotonic()
+    if (_parameters_cache["result"] is not None
+            and _parameters_cache["document"] == document_key
+            and started - _parameters_cache["timestamp"] < _PARAMETERS_CACHE_MAX_AGE):
+        return _copy_parameters_response(_parameters_cache["result"])
+    generation = _parameters_cache["generation"]
 
-        # Check if ComponentDefinition exists (works for Parts and Assemblies)
-        if not hasattr(doc, 'ComponentDefinition'):
-            return {
-                "success": False,
-                "error": "Document does not have ComponentDefinition"
-            }
+    count, read_record = _parameter_reader(doc, component_definition)
 
-        # Get User Parameters ONLY (not all Parameters)
-        user_params = doc.ComponentDefinition.Parameters.UserParameters
-        result = []
+    # Preallocate - slots of parameters that fail to read stay None and are dropped below
+    result = [None] * count
+    skipped = False
 
-        for param in user_params:
-            try:
-                # Safely access parameter properties
-                param_name = param.Name if hasattr(param, 'Name') else str(param)
-                param_value = param.Value if hasattr(param, 'Value') else 0
-                param_unit = param.Units if (hasattr(param, 'Units') and param.Units) else ""
-                param_expression = param.Expression if hasattr(param, 'Expression') else ""
-                param_comment = param.Comment if hasattr(param, 'Comment') else ""
+    for i in range(count):
+        record = read_record(i + 1)
+        if record is None:
+            skipped = True
+        result[i] = record
 
-                # Get internal unit and display value using Inventor's API
-                internal_unit = ""
-                display_value = None
+    if skipped:
+        result = [record for record in result if record is not None]
 
-                try:
-                    # Get internal/database unit from expression using Inventor's API
-                    # This tells us what unit Inventor uses internally (e.g., "cm", "g", "rad")
-                    if param_expression and param_unit:
-                        internal_unit = doc.UnitsOfMeasure.GetDatabaseUnitsFromExpression(
-                            param_expression,
-                            param_unit
-                        )
-                        print(f"DEBUG [{param_name}]: GetDatabaseUnitsFromExpression('{param_expression}', '{param_unit}') = '{internal_unit}'")
-                    elif param_unit:
-                        # For parameters without expression, infer from unit
-                        # Use empty expression to get default database unit for this unit type
-                        internal_unit = doc.UnitsOfMeasure.GetDatabaseUnitsFromExpression(
-                            "",
-                            param_unit
-                        )
-                        print(f"DEBUG [{param_name}]: GetDatabaseUnitsFromExpression('', '{param_unit}') = '{internal_unit}'")
-                    else:
-                        print(f"DEBUG [{param_name}]: No expression or unit, skipping internal unit lookup")
-                except Exception as unit_error:
-                    print(f"WARNING: Could not get internal unit for '{param_name}': {unit_error}")
-                    print(f"DEBUG [{param_name}]: expression='{param_expression}', unit='{param_unit}', value={param_value}")
-                    internal_unit = ""
+    response = {
+        "success": True,
+        "documentName": document_key[1],  # User-friendly metadata (DisplayName)
+        "parameters": result
+    }
 
-                # Get display value using Inventor's unit conversion
-                if internal_unit and param_unit and param_value is not None:
-                    try:
-                        # Convert from internal unit to display unit
-                        display_value = doc.UnitsOfMeasure.ConvertUnits(
-                            param_value,  # Internal/database value
-                            internal_unit,  # From internal unit (e.g., "cm", "g", "rad")
-                            param_unit  # To display unit (e.g., "mm", "kg", "deg")
-                        )
-                        print(f"DEBUG [{param_name}]: ConvertUnits({param_value}, '{internal_unit}', '{param_unit}') = {display_value}")
-                    except Exception as conv_error:
-                        # Conversion failed - use raw value as fallback
-                        display_value = param_value
-                        print(f"WARNING: Unit conversion failed for '{param_name}': {conv_error}")
-                else:
-                    # No units or missing info - use raw value
-                    display_value = param_value
-                    print(f"DEBUG [{param_name}]: No conversion needed/possible - using raw value {param_value} (internal_unit='{internal_unit}', param_unit='{param_unit}')")
-
-                # Parse Comment field for mapping
-                comment_data = parse_comment_mapping(param_comment)
-
-                # Parse expression for userValue and userUnit
-                # If userValue exists → input param; if None → calculated/formula param
-                user_input_data = parse_expression_user_input(param_expression)
-
-                # Debug summary for angle parameters (deg, rad, °)
-                if param_unit and ('deg' in param_unit.lower() or 'rad' in param_unit.lower() or '°' in param_unit):
-                    print(f"DEBUG ANGLE SUMMARY [{param_name}]:")
-                    print(f"  - value (internal): {param_value}")
-                    print(f"  - displayValue: {display_value}")
-                    print(f"  - unit (display): {param_unit}")
-                    print(f"  - internalUnit: '{internal_unit}'")
-                    print(f"  - expression: '{param_expression}'")
-                    print(f"  - userValue: {user_input_data['userValue']}")
-                    print(f"  - userUnit: {user_input_data['userUnit']}")
-
-                result.append({
-                    "name": param_name,
-                    "value": param_value,  # Inventor internal/database units
-                    "displayValue": display_value,  # Value in display unit (from Inventor)
-                    "unit": param_unit,  # Display unit (e.g., "mm", "in")
-                    "internalUnit": internal_unit,  # Internal unit (e.g., "cm", "rad")
-                    "expression": param_expression,
-                    "comment": param_comment,
-                    "mapping": comment_data["mapping"],
-                    "note": comment_data["note"],
-                    "userValue": user_input_data["userValue"],  # User-typed value (None if calculated)
-                    "userUnit": user_input_data["userUnit"]  # User-typed unit (None if calculated)
-                })
-
-            except Exception as param_error:
-                # If we can't read this parameter, skip it and log
-                print(f"WARNING: Could not read parameter '{param_name}': {param_error}")
-                continue
+    # Don't cache a read that raced with a write through this module
+    if _parameters_cache["generation"] == generation:
+        _parameters_cache.update(document=document_key, timestamp=started, result=response)
+        return _copy_parameters_response(response)
 
-        return {
-            "success": True,
-            "documentName": doc.DisplayName,  # User-friendly metadata
-            "parameters": result
-        }
+    return response
+
+
+def iter_user_parameters() -> Iterator[Dict[str, Any]]:
+    """
+    Yield the active document's User Parameter records one at a time.
+
+    Same records as get_user_parameters()["parameters"], produced as each
+    parameter is read from COM, so a consumer can start sending the first
+    records before the last ones are read. Unlike the dict-returning API,
+    a missing document raises RuntimeError (on first iteration).
+
+    COM proxies are bound to the thread that created them, so the iterator
+    must be consumed on a single thread - from async code use
+    aiter_user_parameters(), which drives it on the COM worker thread.
+    """
+    doc = _get_active_document()
+    if doc is None:
+        raise RuntimeError("No active Inventor document")
+
+    try:
+        component_definition = doc.ComponentDefinition
+    except AttributeError:
+        raise RuntimeError("Document does not have ComponentDefinition")
+
+    count, read_record = _parameter_reader(doc, component_definition)
+
+    for index in range(1, count + 1):
+        record = read_record(index)
+        if record is not None:
+            yield record
 
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e),
-            "errorType": type(e).__name__
-        }
-    finally:
-        pythoncom.CoUninitialize()
 
+def _parameter_not_found(name: str) -> Dict[str, Any]:
+    """Error result for a User Parameter name that does not exist."""
+    return {"success": False, "error": f"User Parameter '{name}' not found", "parameter": name}
 
-def update_parameter_mapping(name: str, symbol: Optional[str] = None, note: Optional[str] = None,
-                            value: Optional[float] = None, unit: Optional[str] = None) -> Dict[str, Any]:
+
+def _apply_parameter_mapping(param, name: str, symbol: Optional[str] = None, note: Optional[str] = None,
+                             value: Optional[float] = None, unit: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Write mapping (and optionally value) to one already looked-up User Parameter.
+
+    Shared by update_parameter_mapping() and update_parameter_mappings(); the
+    caller owns the parameter lookup, the transaction and top-level error handling.
+    """
+    # Update Comment field with mapping
+    new_comment = build_comment_string(symbol, note)
+    param.Comment = new_comment
+
+    # Optionally update value
+    # ROBUST APPROACH: If unit is provided, use Expression (e.g., "8 deg")
+    # This lets Inventor handle conversion to internal units for ALL unit types
+    # The response reports what we wrote where possible, re-reading from COM
+    # only when Inventor computed the stored value itself
+    if value is not None:
+        try:
+            if unit and unit.strip() and unit.lower() != 'ul':
+                # Use expression with unit - Inventor handles internal conversion
+                # Works for all unit types: mm, deg, kg/m³, N·m, etc.
+                expression = f"{value} {unit}"
+                param.Expression = expression
+                new_value = param.Value  # Converted to internal units by Inventor
+                log.debug("[update_parameter_mapping] %s: Set Expression = '%s'", name, expression)
+            else:
+                # Unitless - direct value assignment
+                param.Value = value
+                new_value = value
+                log.debug("[update_parameter_mapping] %s: Set Value = %s (unitless)", name, value)
+        except Exception as e:
+            # Value update failed (parameter might have formula/constraints)
+            # But Comment was updated successfully
+            return {
+                "success": False,
+                "error": f"Failed to update value: {str(e)}",
+                "comment": new_comment,
+                "parameter": name,
+                "mapping": symbol,
+                "note": note
+            }
+    else:
+        new_value = param.Value
+
+    return {
+        "success": True,
+        "parameter": name,
+        "comment": new_comment,
+        "mapping": symbol,
+        "note": note,
+        "value": new_value,
+        "unit": param.Units
+    }
+
+
+@_with_inventor_doc(writes=True)
+def update_parameter_mapping(doc, name: str, symbol: Optional[str] = None, note: Optional[str] = None,
+                             value: Optional[float] = None, unit: Optional[str] = None) -> Dict[str, Any]:
     """
     Update User Parameter's Comment field with CalcsLive mapping.
     Optionally also update the parameter's value.
@@ -343,75 +685,100 @@ def update_parameter_mapping(name: str, symbol: Optional[str] = None, note: Opti
     Example:
         update_parameter_mapping("Length", symbol="L", note="Main beam length", value=5.0, unit="m")
     """
-    pythoncom.CoInitialize()
-    try:
-        app = win32com.client.GetActiveObject("Inventor.Application")
-        doc = app.ActiveDocument
+    # Access User Parameters
+    user_params = doc.ComponentDefinition.Parameters.UserParameters
 
-        if doc is None:
-            return {"success": False, "error": "No active Inventor document"}
+    # Find parameter by name - before the transaction, so a missing name
+    # doesn't leave an empty entry on Inventor's Undo list
+    param = _find_user_parameter(user_params, name)
+    if param is None:
+        return _parameter_not_found(name)
 
-        # Access User Parameters
-        user_params = doc.ComponentDefinition.Parameters.UserParameters
+    # Comment and value writes share one transaction (one Undo step)
+    with _transaction(doc, "Update CalcsLive mapping"):
+        return _apply_parameter_mapping(param, name, symbol, note, value, unit)
 
-        # Find parameter by name
-        try:
-            param = user_params.Item(name)
-        except:
-            return {"success": False, "error": f"User Parameter '{name}' not found"}
-
-        # Update Comment field with mapping
-        new_comment = build_comment_string(symbol, note)
-        param.Comment = new_comment
-
-        # Optionally update value
-        # ROBUST APPROACH: If unit is provided, use Expression (e.g., "8 deg")
-        # This lets Inventor handle conversion to internal units for ALL unit types
-        if value is not None:
-            try:
-                if unit and unit.strip() and unit.lower() != 'ul':
-                    # Use expression with unit - Inventor handles internal conversion
-                    # Works for all unit types: mm, deg, kg/m³, N·m, etc.
-                    expression = f"{value} {unit}"
-                    param.Expression = expression
-                    print(f"DEBUG [update_parameter_mapping] {name}: Set Expression = '{expression}'")
-                else:
-                    # Unitless - direct value assignment
-                    param.Value = value
-                    print(f"DEBUG [update_parameter_mapping] {name}: Set Value = {value} (unitless)")
-            except Exception as e:
-                # Value update failed (parameter might have formula/constraints)
-                # But Comment was updated successfully
-                return {
-                    "success": False,
-                    "error": f"Failed to update value: {str(e)}",
-                    "comment": new_comment,
-                    "parameter": name,
-                    "mapping": symbol,
-                    "note": note
-                }
 
-        return {
-            "success": True,
-            "parameter": name,
-            "comment": param.Comment,
-            "mapping": symbol,
-            "note": note,
-            "value": param.Value,
-            "unit": param.Units
-        }
+@_with_inventor_doc(writes=True)
+def update_parameter_mappings(doc, updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Update several User Parameters' mappings (and optionally values) in one call.
 
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e),
-            "errorType": type(e).__name__
-        }
-    finally:
-        pythoncom.CoUninitialize()
+    Resolves the document and UserParameters collection once for the whole
+    batch instead of once per parameter, and applies every write inside a
+    single Inventor transaction (one Undo step). Each update is applied
+    independently; a failing entry does not stop the rest.
 
+    Args:
+        updates: List of dicts with the same fields as update_parameter_mapping():
+            "name" (required), "symbol", "note", "value", "unit"
 
-def create_user_parameter(name: str, value: str = "", comment: str = "", unit: str = "Text") -> Dict[str, Any]:
+    Returns:
+        Dict with per-parameter results in request order
+        Example:
+            {
+                "success": False,  # True only if every update succeeded
+                "updated": 1,
+                "failed": 1,
+                "results": [
+                    {"success": True, "parameter": "Length", ...},
+                    {"success": False, "error": "User Parameter 'Wdth' not found", "parameter": "Wdth"}
+                ]
+            }
+    """
+    user_params = doc.ComponentDefinition.Parameters.UserParameters
+    results: List[Optional[Dict[str, Any]]] = [None] * len(updates)
+
+    def failure(name: str, e: Exception) -> Dict[str, Any]:
+        return {"success": False, "parameter": name, "error": str(e), "errorType": type(e).__name__}
+
+    # Resolve every name first; the transaction is only opened if something
+    # is actually going to be written
+    found = []
+    for i, update in enumerate(updates):
+        name = update.get("name")
+        if not name:
+            results[i] = {"success": False, "error": "Parameter 'name' is required"}
+            continue
+
+        try:
+            param = _find_user_parameter(user_params, name)
+        except Exception as e:
+            results[i] = failure(name, e)
+            continue
+
+        if param is None:
+            results[i] = _parameter_not_found(name)
+        else:
+            found.append((i, param, update))
+
+    if found:
+        with _transaction(doc, "Update CalcsLive mappings"):
+            for i, param, update in found:
+                name = update["name"]
+                try:
+                    results[i] = _apply_parameter_mapping(
+                        param,
+                        name,
+                        update.get("symbol"),
+                        update.get("note"),
+                        update.get("value"),
+                        update.get("unit")
+                    )
+                except Exception as e:
+                    results[i] = failure(name, e)
+
+    failed = sum(1 for r in results if not r.get("success"))
+    return {
+        "success": failed == 0,
+        "updated": len(results) - failed,
+        "failed": failed,
+        "results": results
+    }
+
+
+@_with_inventor_doc(writes=True)
+def create_user_parameter(doc, name: str, value: str = "", comment: str = "", unit: str = "Text") -> Dict[str, Any]:
     """
     Create a new User Parameter in active Inventor document.
 
@@ -432,77 +799,58 @@ def create_user_parameter(name: str, value: str = "", comment: str = "", unit: s
             "Text"
         )
     """
-    pythoncom.CoInitialize()
-    try:
-        app = win32com.client.GetActiveObject("Inventor.Application")
-        doc = app.ActiveDocument
+    # Access User Parameters collection
+    user_params = doc.ComponentDefinition.Parameters.UserParameters
 
-        if doc is None:
-            return {"success": False, "error": "No active Inventor document"}
-
-        # Access User Parameters collection
-        user_params = doc.ComponentDefinition.Parameters.UserParameters
-
-        # Check if parameter already exists
-        try:
-            existing_param = user_params.Item(name)
-            return {
-                "success": False,
-                "error": f"User Parameter '{name}' already exists",
-                "parameterExists": True,
-                "existingValue": existing_param.Expression,
-                "existingUnit": existing_param.Units,
-                "existingComment": existing_param.Comment
-            }
-        except:
-            # Parameter doesn't exist - good, we can create it
-            pass
-
-        # Create new User Parameter
-        try:
-            if unit.lower() == "text" or unit == "":
-                # Text parameter - use AddByValue with kTextUnits enum
-                # Inventor API documentation: kTextUnits = 11346 (Text/String type)
-                new_param = user_params.AddByValue(name, value or "", 11346)
-            else:
-                # Numeric parameter with units - use AddByExpression
-                expression = f"{value} {unit}" if value else f"0 {unit}"
-                new_param = user_params.AddByExpression(name, expression, unit)
-
-            # Set comment if provided
-            if comment:
-                new_param.Comment = comment
+    # Check if parameter already exists
+    existing_param = _find_user_parameter(user_params, name)
+    if existing_param is not None:
+        return {
+            "success": False,
+            "error": f"User Parameter '{name}' already exists",
+            "parameterExists": True,
+            "existingValue": existing_param.Expression,
+            "existingUnit": existing_param.Units,
+            "existingComment": existing_param.Comment
+        }
 
-            return {
-                "success": True,
-                "parameter": name,
-                "value": new_param.Expression,
-                "unit": new_param.Units,
-                "comment": new_param.Comment,
-                "message": f"User Parameter '{name}' created successfully"
-            }
+    # Create new User Parameter
+    try:
+        if unit.lower() == "text" or unit == "":
+            # Text parameter - use AddByValue with kTextUnits enum
+            # Inventor API documentation: kTextUnits = 11346 (Text/String type)
+            new_param = user_params.AddByValue(name, value or "", 11346)
+        else:
+            # Numeric parameter with units - use AddByExpression
+            expression = f"{value} {unit}" if value else f"0 {unit}"
+            new_param = user_params.AddByExpression(name, expression, unit)
+
+        # Set comment if provided
+        if comment:
+            new_param.Comment = comment
 
-        except Exception as create_error:
-            error_code = getattr(create_error, 'hresult', None)
-            return {
-                "success": False,
-                "error": f"Failed to create parameter: {str(create_error)}",
-                "errorType": type(create_error).__name__,
-                "errorCode": error_code,
-                "details": "Check parameter name validity and Inventor document state"
-            }
+        return {
+            "success": True,
+            "parameter": name,
+            "value": new_param.Expression,
+            "unit": new_param.Units,
+            "comment": new_param.Comment,
+            "message": f"User Parameter '{name}' created successfully"
+        }
 
-    except Exception as e:
+    except Exception as create_error:
+        error_code = getattr(create_error, 'hresult', None)
         return {
             "success": False,
-            "error": str(e),
-            "errorType": type(e).__name__
+            "error": f"Failed to create parameter: {str(create_error)}",
+            "errorType": type(create_error).__name__,
+            "errorCode": error_code,
+            "details": "Check parameter name validity and Inventor document state"
         }
-    finally:
-        pythoncom.CoUninitialize()
 
 
-def convert_units(value: float, from_unit: str, to_unit: str) -> Dict[str, Any]:
+@_with_inventor_doc
+def convert_units(doc, value: float, from_unit: str, to_unit: str) -> Dict[str, Any]:
     """
     Convert a value between units using Inventor's UnitsOfMeasure API.
 
@@ -523,43 +871,84 @@ def convert_units(value: float, from_unit: str, to_unit: str) -> Dict[str, Any]:
         convert_units(60.96, "cm", "in") → {"success": True, "value": 24.0, ...}
         convert_units(0.139626, "rad", "deg") → {"success": True, "value": 8.0, ...}
     """
-    pythoncom.CoInitialize()
+    # Use Inventor's UnitsOfMeasure for conversion
+    uom = doc.UnitsOfMeasure
+
     try:
-        app = win32com.client.GetActiveObject("Inventor.Application")
-        doc = app.ActiveDocument
+        converted_value = uom.ConvertUnits(value, from_unit, to_unit)
+        log.debug("[convert_units] ConvertUnits(%s, '%s', '%s') = %s", value, from_unit, to_unit, converted_value)
+
+        return {
+            "success": True,
+            "value": converted_value,
+            "fromUnit": from_unit,
+            "toUnit": to_unit,
+            "originalValue": value
+        }
+    except Exception as conv_error:
+        log.error("[convert_units] ConvertUnits(%s, '%s', '%s') failed: %s", value, from_unit, to_unit, conv_error)
+        return {
+            "success": False,
+            "error": f"Conversion failed: {str(conv_error)}",
+            "fromUnit": from_unit,
+            "toUnit": to_unit,
+            "originalValue": value
+        }
 
-        if doc is None:
-            return {"success": False, "error": "No active Inventor document"}
 
-        # Use Inventor's UnitsOfMeasure for conversion
-        uom = doc.UnitsOfMeasure
+# ============================================================================
+# ASYNC API
+# ============================================================================
+# Inventor is a single-threaded-apartment COM server, so all calls from async
+# hosts are funnelled through one long-lived worker thread. That thread
+# initializes COM once and owns the cached Application proxy, and the event
+# loop is never blocked on COM round trips.
 
-        try:
-            converted_value = uom.ConvertUnits(value, from_unit, to_unit)
-            print(f"DEBUG [convert_units]: ConvertUnits({value}, '{from_unit}', '{to_unit}') = {converted_value}")
+_COM_POOL = ThreadPoolExecutor(max_workers=1, initializer=init_com, thread_name_prefix="inventor-com")
 
-            return {
-                "success": True,
-                "value": converted_value,
-                "fromUnit": from_unit,
-                "toUnit": to_unit,
-                "originalValue": value
-            }
-        except Exception as conv_error:
-            print(f"ERROR [convert_units]: ConvertUnits({value}, '{from_unit}', '{to_unit}') failed: {conv_error}")
-            return {
-                "success": False,
-                "error": f"Conversion failed: {str(conv_error)}",
-                "fromUnit": from_unit,
-                "toUnit": to_unit,
-                "originalValue": value
-            }
 
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e),
-            "errorType": type(e).__name__
-        }
+async def _run_on_com_thread(fn, *args, **kwargs):
+    """Run a blocking API function on the dedicated COM thread and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_COM_POOL, partial(fn, *args, **kwargs))
+
+
+async def aget_user_parameters() -> Dict[str, Any]:
+    """Async variant of get_user_parameters(), run on the COM thread."""
+    return await _run_on_com_thread(get_user_parameters)
+
+
+async def aiter_user_parameters() -> AsyncIterator[Dict[str, Any]]:
+    """Async variant of iter_user_parameters(); every step runs on the COM thread."""
+    records = iter_user_parameters()
+    done = object()
+    try:
+        while True:
+            record = await _run_on_com_thread(next, records, done)
+            if record is done:
+                return
+            yield record
     finally:
-        pythoncom.CoUninitialize()
\ No newline at end of file
+        # Release the generator's COM proxies on the thread that owns them
+        await _run_on_com_thread(records.close)
+
+
+async def aupdate_parameter_mapping(name: str, symbol: Optional[str] = None, note: Optional[str] = None,
+                                    value: Optional[float] = None, unit: Optional[str] = None) -> Dict[str, Any]:
+    """Async variant of update_parameter_mapping(), run on the COM thread."""
+    return await _run_on_com_thread(update_parameter_mapping, name, symbol, note, value, unit)
+
+
+async def aupdate_parameter_mappings(updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Async variant of update_parameter_mappings(), run on the COM thread."""
+    return await _run_on_com_thread(update_parameter_mappings, updates)
+
+
+async def acreate_user_parameter(name: str, value: str = "", comment: str = "", unit: str = "Text") -> Dict[str, Any]:
+    """Async variant of create_user_parameter(), run on the COM thread."""
+    return await _run_on_com_thread(create_user_parameter, name, value, comment, unit)
+
+
+async def aconvert_units(value: float, from_unit: str, to_unit: str) -> Dict[str, Any]:
+    """Async variant of convert_units(), run on the COM thread."""
+    return await _run_on_com_thread(convert_units, value, from_unit, to_unit)
@@ -1,30 +1,43 @@
 # main.py
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.types import ASGIApp, Receive, Scope, Send
 from starlette.datastructures import MutableHeaders
+from pydantic import BaseModel, Field
+from typing import List, Optional, Union
 from inventor_api import (
-    get_user_parameters,
-    update_parameter_mapping,
-    create_user_parameter,
-    convert_units
+    aget_user_parameters,
+    aiter_user_parameters,
+    aupdate_parameter_mapping,
+    aupdate_parameter_mappings,
+    acreate_user_parameter,
+    aconvert_units
 )
+import orjson
 import uvicorn
 
 # Read version from pyproject.toml
 def get_version():
     try:
-        import toml
-        with open("pyproject.toml", "r") as f:
-            data = toml.load(f)
-            return data["project"]["version"]
-    except:
+        try:
+            import tomllib  # Python 3.11+ stdlib parser
+        except ImportError:
+            import tomli as tomllib  # Same API, backport for older Pythons
+        with open("pyproject.toml", "rb") as f:
+            data = tomllib.load(f)
+        return data["project"]["version"]
+    except Exception:
         return "1.1.1"  # Fallback version
 
+# Parsed once at import - health endpoints are polled and must not re-read the file
+VERSION = get_version()
+
 app = FastAPI(
     title="CalcsLive Plug for Inventor",
     description="HTTP bridge for Inventor User Parameters with CalcsLive integration",
-    version=get_version()
+    version=VERSION
 )
 
 # Private Network Access (PNA) middleware — required for Chrome/Brave to allow
@@ -87,20 +100,74 @@ app.add_middleware(
 # Must be outermost so it intercepts PNA preflights before CORSMiddleware
 app.add_middleware(PrivateNetworkAccessMiddleware)
 
+# Request bodies - validated by pydantic-core before the handler runs.
+# A missing or invalid field is rejected with 400 (see validation_error_handler).
+# Numeric values are Union[int, float] so JSON integers stay integers -
+# they end up in Inventor expressions ("24 mm", not "24.0 mm").
+class MappingUpdate(BaseModel):
+    name: str = Field(min_length=1)
+    symbol: Optional[str] = None
+    note: Optional[str] = None
+    value: Optional[Union[int, float]] = None
+    unit: Optional[str] = None
+
+class BulkMappingUpdate(BaseModel):
+    updates: List[MappingUpdate]
+
+class MappingRemoval(BaseModel):
+    name: str = Field(min_length=1)
+
+class ParameterCreate(BaseModel):
+    name: str = Field(min_length=1)
+    value: Optional[Union[str, int, float]] = ""  # null accepted, treated as ""
+    comment: Optional[str] = ""
+    unit: str = "Text"
+
+class UnitConversion(BaseModel):
+    value: float
+    from_unit: str = Field(alias="fromUnit", min_length=1)
+    to_unit: str = Field(alias="toUnit", min_length=1)
+
+# pydantic appends the member type to "loc" for errors on Union fields
+# (e.g. ("body", "value", "int")) - not part of the field name
+_UNION_MEMBER_TAGS = {"str", "int", "float"}
+
+@app.exception_handler(RequestValidationError)
+async def validation_error_handler(request: Request, exc: RequestValidationError):
+    """
+    Report an invalid request body as 400 with a single "detail" message -
+    the error shape clients got before the bodies were pydantic models -
+    instead of FastAPI's default 422 with a list of error objects.
+    """
+    error = exc.errors()[0]
+    loc = list(error["loc"][1:])  # drop the leading "body"
+    while loc and loc[-1] in _UNION_MEMBER_TAGS:
+        loc.pop()
+    field = ".".join(str(part) for part in loc) or "body"
+    if error["type"] == "json_invalid":
+        message = "Request body is not valid JSON"
+    elif error["type"] == "missing" or error.get("input") in (None, ""):
+        message = f"'{field}' is required"
+        if field == "name":
+            message = f"Parameter {message}"
+    else:
+        message = f"Invalid '{field}': {error['msg']}"
+    return JSONResponse(status_code=400, content={"detail": message})
+
 @app.get("/")
 def root():
     """Health check endpoint"""
-    return {"status": "ok", "service": "CalcsLive Plug for Inventor", "version": get_version()}
+    return {"status": "ok", "service": "CalcsLive Plug for Inventor", "version": VERSION}
 
 @app.get("/inventor/health")
 def health_check():
     """Health check for Inventor-specific endpoints"""
-    return {"status": "ok", "service": "CalcsLive Plug for Inventor", "version": get_version()}
+    return {"status": "ok", "service": "CalcsLive Plug for Inventor", "version": VERSION}
 
 @app.get("/inventor/document")
-def get_document_info():
+async def get_document_info():
     """Get active Inventor document information"""
-    result = get_user_parameters()
+    result = await aget_user_parameters()
     if result.get("success"):
         return {
             "status": "connected",
@@ -111,20 +178,49 @@ def get_document_info():
         raise HTTPException(status_code=503, detail=result.get("error"))
 
 @app.get("/inventor/parameters")
-def read_user_parameters():
+async def read_user_parameters():
     """
     Get User Parameters from active Inventor document.
     Includes Comment field parsing for CalcsLive mappings and dimensional analysis.
     """
-    result = get_user_parameters()
+    result = await aget_user_parameters()
 
     if not result.get("success"):
         raise HTTPException(status_code=503, detail=result.get("error"))
 
-    return result
+    # Serialize straight to bytes with orjson - skips FastAPI's jsonable_encoder
+    # walk over every parameter dict and the stdlib json.dumps pass. A plain
+    # Response is used because ORJSONResponse is deprecated in newer FastAPI.
+    return Response(content=orjson.dumps(result), media_type="application/json")
+
+@app.get("/inventor/parameters/stream")
+async def stream_user_parameters():
+    """
+    Stream User Parameters as NDJSON (one parameter record per line).
+
+    Same records as /inventor/parameters, written as each parameter is read
+    from Inventor - useful for large assemblies. The first record is read
+    before responding, so a missing document still returns 503.
+    """
+    records = aiter_user_parameters()
+    try:
+        first = await records.__anext__()
+    except StopAsyncIteration:
+        first = None
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    async def ndjson_lines():
+        if first is None:
+            return
+        yield orjson.dumps(first) + b"\n"
+        async for record in records:
+            yield orjson.dumps(record) + b"\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
 
 @app.post("/inventor/parameters/mapping")
-def set_parameter_mapping(data: dict):
+async def set_parameter_mapping(body: MappingUpdate):
     """
     Set or update User Parameter Comment field with CalcsLive mapping.
     Optionally also update the parameter value.
@@ -140,24 +236,41 @@ def set_parameter_mapping(data: dict):
 
     To remove mapping, pass symbol=null or omit it
     """
-    name = data.get("name")
-    symbol = data.get("symbol")
-    note = data.get("note")
-    value = data.get("value")
-    unit = data.get("unit")
+    result = await aupdate_parameter_mapping(body.name, body.symbol, body.note, body.value, body.unit)
+
+    if not result.get("success"):
+        raise HTTPException(status_code=400, detail=result.get("error"))
+
+    return result
+
+@app.post("/inventor/parameters/bulk")
+async def set_parameter_mappings(body: BulkMappingUpdate):
+    """
+    Set mappings (and optionally values) for several User Parameters at once.
+    All writes share one Inventor transaction, so they form a single Undo step.
 
-    if not name:
-        raise HTTPException(status_code=400, detail="Parameter 'name' is required")
+    Request body:
+    {
+        "updates": [
+            {"name": "Length", "symbol": "L", "value": 5.0, "unit": "m"},
+            {"name": "Width", "symbol": "W", "note": "Beam width"}
+        ]
+    }
 
-    result = update_parameter_mapping(name, symbol, note, value, unit)
+    Each entry takes the same fields as /inventor/parameters/mapping.
+    Entries are applied independently - check "results" for per-parameter
+    outcomes; "success" is true only if every entry succeeded.
+    """
+    result = await aupdate_parameter_mappings([update.model_dump() for update in body.updates])
 
-    if not result.get("success"):
+    # Document-level failure (no document, no ComponentDefinition, ...)
+    if "results" not in result:
         raise HTTPException(status_code=400, detail=result.get("error"))
 
     return result
 
 @app.delete("/inventor/parameters/mapping")
-def remove_parameter_mapping(data: dict):
+async def remove_parameter_mapping(body: MappingRemoval):
     """
     Remove CalcsLive mapping from User Parameter Comment field.
 
@@ -166,13 +279,8 @@ def remove_parameter_mapping(data: dict):
         "name": "Length"  // required
     }
     """
-    name = data.get("name")
-
-    if not name:
-        raise HTTPException(status_code=400, detail="Parameter 'name' is required")
-
     # Clear mapping by setting symbol to None
-    result = update_parameter_mapping(name, symbol=None, note=None)
+    result = await aupdate_parameter_mapping(body.name, symbol=None, note=None)
 
     if not result.get("success"):
         raise HTTPException(status_code=400, detail=result.get("error"))
@@ -180,7 +288,7 @@ def remove_parameter_mapping(data: dict):
     return result
 
 @app.post("/inventor/parameters/create")
-def create_parameter(data: dict):
+async def create_parameter(body: ParameterCreate):
     """
     Create a new User Parameter in Inventor.
 
@@ -196,15 +304,8 @@ def create_parameter(data: dict):
     - Create ArticleId parameter for CalcsLive integration
     - Create custom text or numeric parameters programmatically
     """
-    name = data.get("name")
-    value = data.get("value", "")
-    comment = data.get("comment", "")
-    unit = data.get("unit", "Text")
-
-    if not name:
-        raise HTTPException(status_code=400, detail="Parameter 'name' is required")
-
-    result = create_user_parameter(name, value, comment, unit)
+    value = "" if body.value is None else body.value
+    result = await acreate_user_parameter(body.name, value, body.comment or "", body.unit)
 
     if not result.get("success"):
         raise HTTPException(status_code=400, detail=result.get("error"))
@@ -213,7 +314,7 @@ def create_parameter(data: dict):
 
 
 @app.post("/inventor/convert")
-def convert_unit_value(data: dict):
+async def convert_unit_value(body: UnitConversion):
     """
     Convert a value between units using Inventor's UnitsOfMeasure API.
 
@@ -238,18 +339,7 @@ def convert_unit_value(data: dict):
         "originalValue": 609.6
     }
     """
-    value = data.get("value")
-    from_unit = data.get("fromUnit")
-    to_unit = data.get("toUnit")
-
-    if value is None:
-        raise HTTPException(status_code=400, detail="'value' is required")
-    if not from_unit:
-        raise HTTPException(status_code=400, detail="'fromUnit' is required")
-    if not to_unit:
-        raise HTTPException(status_code=400, detail="'toUnit' is required")
-
-    result = convert_units(value, from_unit, to_unit)
+    result = await aconvert_units(body.value, body.from_unit, body.to_unit)
 
     if not result.get("success"):
         raise HTTPException(status_code=400, detail=result.get("error"))
@@ -258,4 +348,14 @@ def convert_unit_value(data: dict):
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="127.0.0.1", port=8000)
\ No newline at end of file
+    # uvloop has no Windows build; winloop is the drop-in port for Inventor hosts.
+    # With it installed, "none" tells uvicorn to keep the policy set here.
+    try:
+        import winloop
+        winloop.install()
+        loop = "none"
+    except ImportError:
+        loop = "auto"  # uvloop where available, otherwise asyncio
+
+    # httptools ships with uvicorn[standard]
+    uvicorn.run(app, host="127.0.0.1", port=8000, loop=loop, http="httptools", workers=1)
\ No newline at end of file
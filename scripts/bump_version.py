@@ -12,9 +12,14 @@ Examples:
 """
 
 import sys
-import toml
 from pathlib import Path
 
+try:
+    import tomllib  # Python 3.11+ stdlib parser
+except ImportError:
+    import tomli as tomllib
+import tomli_w
+
 
 def bump_version(version: str, bump_type: str) -> str:
     """
@@ -44,19 +49,24 @@ def bump_version(version: str, bump_type: str) -> str:
     return f"{major}.{minor}.{patch}"
 
 
-def update_pyproject_version(new_version: str):
-    """Update version in pyproject.toml"""
-    pyproject_path = Path("pyproject.toml")
-
+def load_pyproject(pyproject_path: Path = Path("pyproject.toml")) -> dict:
+    """Load pyproject.toml"""
     if not pyproject_path.exists():
         raise FileNotFoundError("pyproject.toml not found")
 
-    data = toml.load(pyproject_path)
+    with open(pyproject_path, "rb") as f:
+        return tomllib.load(f)
+
+
+def update_pyproject_version(data: dict, new_version: str):
+    """Update version in pyproject.toml, given its already-loaded contents"""
+    pyproject_path = Path("pyproject.toml")
+
     old_version = data["project"]["version"]
     data["project"]["version"] = new_version
 
-    with open(pyproject_path, "w") as f:
-        toml.dump(data, f)
+    with open(pyproject_path, "wb") as f:
+        tomli_w.dump(data, f)
 
     print(f"✓ Updated pyproject.toml: {old_version} -> {new_version}")
     return old_version
@@ -76,14 +86,14 @@ def main():
 
     try:
         # Read current version
-        data = toml.load("pyproject.toml")
+        data = load_pyproject()
         current_version = data["project"]["version"]
 
         # Calculate new version
         new_version = bump_version(current_version, bump_type)
 
         # Update files
-        old_version = update_pyproject_version(new_version)
+        old_version = update_pyproject_version(data, new_version)
 
         print(f"\n🎉 Version bumped successfully!")
         print(f"   {old_version} -> {new_version} ({bump_type})")
@@ -4,65 +4,7 @@ Run with: pytest test_comment_parser.py -v
 """
 import pytest
 
-
-def parse_comment_mapping(comment: str):
-    """Copy of the parser from inventor_api.py for testing"""
-    result = {"mapping": None, "note": None}
-
-    if not comment or not comment.strip():
-        return result
-
-    comment = comment.strip()
-
-    # Split on first # to separate namespace:symbol from note
-    if '#' in comment:
-        mapping_part, note_part = comment.split('#', 1)  # maxsplit=1 preserves # in notes
-        result["note"] = note_part.strip() if note_part.strip() else None
-    else:
-        mapping_part = comment
-        result["note"] = None
-
-    # Parse namespace:symbol
-    mapping_part = mapping_part.strip()
-    if ':' not in mapping_part:
-        return {"mapping": None, "note": None}  # Invalid: no namespace
-
-    namespace, symbol = mapping_part.split(':', 1)
-    namespace = namespace.strip()
-    symbol = symbol.strip()
-
-    # Validate namespace (must be CA followed by digit(s))
-    if not namespace.startswith('CA') or len(namespace) < 3:
-        return {"mapping": None, "note": None}
-
-    # Validate namespace has digit after CA
-    try:
-        int(namespace[2:])  # Check CA0, CA1, etc.
-    except ValueError:
-        return {"mapping": None, "note": None}
-
-    # Validate symbol (non-empty, no colons - MathJS compatibility)
-    if not symbol or ':' in symbol:
-        return {"mapping": None, "note": None}
-
-    result["mapping"] = symbol
-
-    return result
-
-
-def build_comment_string(symbol, note=None, namespace="CA0"):
-    """Copy of the builder from inventor_api.py for testing"""
-    if not symbol:
-        return ""
-
-    # Build namespace:symbol part
-    comment = f"{namespace}:{symbol}"
-
-    # Append note if provided (preserve as-is, including any # or backticks)
-    if note and note.strip():
-        comment = f"{comment} #{note.strip()}"
-
-    return comment
+from inventor_api import parse_comment_mapping, build_comment_string
 
 
 # ============================================================================
@@ -99,6 +41,18 @@ class TestParseCommentMapping:
     def test_leading_trailing_spaces(self):
         assert parse_comment_mapping(" CA0:L #Note ") == {"mapping": "L", "note": "Note"}
 
+    def test_no_space_before_hash(self):
+        assert parse_comment_mapping("CA0:L#Note") == {"mapping": "L", "note": "Note"}
+
+    def test_multi_digit_namespace(self):
+        assert parse_comment_mapping("CA12:d0") == {"mapping": "d0", "note": None}
+
+    def test_empty_note(self):
+        assert parse_comment_mapping("CA0:L #") == {"mapping": "L", "note": None}
+
+    def test_colon_in_note(self):
+        assert parse_comment_mapping("CA0:L #ratio 1:2") == {"mapping": "L", "note": "ratio 1:2"}
+
     # Invalid cases
     def test_empty_string(self):
         assert parse_comment_mapping("") == {"mapping": None, "note": None}
@@ -130,6 +84,13 @@ class TestParseCommentMapping:
     def test_whitespace_only(self):
         assert parse_comment_mapping("   ") == {"mapping": None, "note": None}
 
+    # Memoized results are shared between callers
+    def test_cached_result_is_read_only(self):
+        result = parse_comment_mapping("CA0:L #Note")
+        with pytest.raises(TypeError):
+            result["mapping"] = "X"
+        assert parse_comment_mapping("CA0:L #Note") == {"mapping": "L", "note": "Note"}
+
 
 # ============================================================================
 # BUILDER TESTS
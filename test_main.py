@@ -0,0 +1,108 @@
+"""
+Test cases for request body validation in main.py (no Inventor/COM needed)
+Run with: pytest test_main.py -v
+"""
+import pytest
+
+pytest.importorskip("httpx")  # required by FastAPI's TestClient
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+client = TestClient(app)
+
+
+# ============================================================================
+# VALIDATION ERROR TESTS
+# ============================================================================
+
+class TestValidationErrors:
+    """Invalid bodies are rejected with 400 and a single "detail" message"""
+
+    def test_missing_name(self):
+        response = client.post("/inventor/parameters/mapping", json={"symbol": "L"})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Parameter 'name' is required"}
+
+    def test_empty_name(self):
+        # TestClient.delete() takes no body - send it through request()
+        response = client.request("DELETE", "/inventor/parameters/mapping", json={"name": ""})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Parameter 'name' is required"}
+
+    def test_missing_aliased_field(self):
+        response = client.post("/inventor/convert", json={"value": 1, "toUnit": "in"})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "'fromUnit' is required"}
+
+    def test_null_required_value(self):
+        response = client.post("/inventor/convert", json={"value": None, "fromUnit": "mm", "toUnit": "in"})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "'value' is required"}
+
+    def test_union_field_names_field_not_member_type(self):
+        response = client.post("/inventor/parameters/mapping", json={"name": "L", "value": "abc"})
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("Invalid 'value': ")
+
+    def test_union_field_in_list(self):
+        response = client.post("/inventor/parameters/bulk", json={"updates": [{"name": "L", "value": "abc"}]})
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("Invalid 'updates.0.value': ")
+
+    def test_missing_field_in_list(self):
+        response = client.post("/inventor/parameters/bulk", json={"updates": [{"symbol": "L"}]})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "'updates.0.name' is required"}
+
+    def test_invalid_json(self):
+        response = client.post(
+            "/inventor/parameters/mapping",
+            content=b"not json",
+            headers={"Content-Type": "application/json"}
+        )
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Request body is not valid JSON"}
+
+    def test_missing_body(self):
+        response = client.post("/inventor/parameters/mapping")
+        assert response.status_code == 400
+        assert response.json() == {"detail": "'body' is required"}
+
+
+# ============================================================================
+# REQUEST BODY TESTS
+# ============================================================================
+
+class TestCreateParameterBody:
+    """Body fields reach create_user_parameter unchanged (Inventor call replaced)"""
+
+    @pytest.fixture
+    def created(self, monkeypatch):
+        calls = []
+
+        async def fake_create(name, value, comment, unit):
+            calls.append((name, value, comment, unit))
+            return {"success": True, "parameter": name}
+
+        monkeypatch.setattr("main.acreate_user_parameter", fake_create)
+        return calls
+
+    def test_null_value_and_comment(self, created):
+        response = client.post("/inventor/parameters/create", json={"name": "A", "value": None, "comment": None})
+        assert response.status_code == 200
+        assert created == [("A", "", "", "Text")]
+
+    def test_defaults(self, created):
+        client.post("/inventor/parameters/create", json={"name": "A"})
+        assert created == [("A", "", "", "Text")]
+
+    def test_integer_value_stays_integer(self, created):
+        client.post("/inventor/parameters/create", json={"name": "A", "value": 24, "unit": "mm"})
+        assert created == [("A", 24, "", "mm")]
+        assert type(created[0][1]) is int
+
+    def test_text_value(self, created):
+        client.post("/inventor/parameters/create", json={"name": "ArticleId", "value": "3MAV4GNFQ-3FU"})
+        assert created == [("ArticleId", "3MAV4GNFQ-3FU", "", "Text")]